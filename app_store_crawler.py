@@ -7,147 +7,345 @@
 * @ Description: Apple App Store 爬蟲程式
 """
 
-import json
-import math
+import asyncio
 import re
-import time
+from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import quote
 
-import pandas as pd
-import requests
+import aiohttp
+import numpy as np
+import orjson
+from aiohttp_client_cache import CachedSession, SQLiteBackend
+
+# iTunes API 並發請求上限
+MAX_CONCURRENT_REQUESTS = 64
+# 單次請求超時設定（秒）
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+# 空閒 keep-alive 連接的保留時間與 DNS 緩存時間（秒）
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+# 遇到 429/5xx 時的最大重試次數與單次等待上限（秒）
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 60
+# 評論 API 每頁返回的評論數量上限
+REVIEWS_PER_PAGE = 50
+# 本地響應緩存（SQLite）的默認過期時間（秒），響應帶 Cache-Control 時以其為準
+CACHE_NAME = "itunes_cache"
+CACHE_EXPIRE_AFTER = 3600
+
+# 由單一字符重複組成的內容（如 "!!!!!!"、"好好好好好"）
+_REPEAT_CHAR_RE = re.compile(r"^(.)\1*$")
+
+# 評分數量權重的對數分母（評分數量達到 10000 時權重為 1）
+_LOG_10000 = np.log(10000)
+
+_session = None
+_semaphore = None
+
+
+def get_session():
+    """
+    獲取共用的 HTTP 會話（首次調用時創建，響應緩存於本地 SQLite）
+    :return: CachedSession
+    """
+    global _session, _semaphore
+
+    if _session is None or _session.closed:
+        cache = SQLiteBackend(cache_name=CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER, cache_control=True)
+        # 連接池與並發上限一致，所有請求復用同一批 keep-alive 連接，TLS 握手只需進行一次
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT_REQUESTS,
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        _session = CachedSession(cache=cache, connector=connector, timeout=REQUEST_TIMEOUT)
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    return _session
+
+
+async def close_session():
+    """
+    關閉共用的 HTTP 會話
+    """
+    global _session
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def retry_delay(response, backoff):
+    """
+    計算重試前的等待時間，優先遵循服務器返回的 Retry-After
+    :param response: 需要重試的響應
+    :param backoff: 當前的指數退避時間（秒）
+    :return: 等待時間（秒），不超過 MAX_RETRY_DELAY
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    # Retry-After 也可能是 HTTP 日期，這種情況下退回指數退避
+    delay = int(retry_after) if retry_after.isdigit() else backoff
+
+    return min(delay, MAX_RETRY_DELAY)
+
+
+async def fetch_json(url):
+    """
+    發送 GET 請求並解析 JSON 響應，遇到 429/5xx 時按 Retry-After 或指數退避重試
+    :param url: 請求地址
+    :return: 解析後的 JSON 數據
+    """
+    session = get_session()
+    backoff = 1
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with _semaphore:
+            async with session.get(url) as response:
+                retryable = response.status == 429 or response.status >= 500
+                if not retryable or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    # iTunes API 的 Content-Type 並非 application/json，直接解析響應內容
+                    return orjson.loads(await response.read())
+                delay = retry_delay(response, backoff)
+
+        # 在信號量之外等待，避免佔用並發名額
+        await asyncio.sleep(delay)
+        backoff *= 2
+
+
+@dataclass(slots=True)
+class AppRecord:
+    """
+    應用信息（只保留搜索 API 結果中用到的字段，缺失時使用默認值）
+    """
+
+    trackId: int | None = None
+    trackName: str = "N/A"
+    artistName: str = "N/A"
+    primaryGenreName: str = "N/A"
+    price: float = 0
+    currency: str = "USD"
+    formattedPrice: str = "N/A"
+    isGameCenterEnabled: bool = False
+    price_tier: str = "N/A"
+    # 評分相關字段缺失時為 None：計算評分時按 0 處理，輸出時顯示 "N/A"
+    averageUserRating: float | None = None
+    userRatingCount: int | None = None
+    version: str = "N/A"
+    fileSizeBytes: str = "N/A"
+    minimumOsVersion: str = "N/A"
+    trackViewUrl: str = "N/A"
+    currentVersionReleaseDate: str = "N/A"
+    description: str = "N/A"
+
+    @classmethod
+    def from_api(cls, result):
+        """
+        從搜索 API 返回的單條結果創建
+        :param result: 搜索結果字典
+        :return: AppRecord
+        """
+        return cls(**{name: result[name] for name in _APP_RECORD_FIELDS if name in result})
+
+
+_APP_RECORD_FIELDS = tuple(field.name for field in fields(AppRecord))
+
+
+@lru_cache(maxsize=256, typed=True)
+def format_price_label(price):
+    """
+    格式化價格顯示文字（價格檔位有限，結果可緩存）
+    :param price: 價格
+    :return: 價格文字
+    """
+    return f"${price}" if price > 0 else "免費"
 
 
 def format_price(app):
     """
     格式化價格信息
-    :param app: 應用信息
+    :param app: AppRecord 應用信息
     :return: 價格詳細信息字典
     """
-    price = app.get("price", 0)
-    currency = app.get("currency", "USD")
+    price = app.price
 
     price_info = {
         "價格類型": "免費" if price == 0 else "付費",
-        "當前價格": f"${price}" if price > 0 else "免費",
-        "幣種": currency,
-        "原價": app.get("formattedPrice", "N/A"),
-        "應用內購買": "是" if app.get("isGameCenterEnabled") else "否",
-        "價格等級": f"Tier {app.get('price_tier', 'N/A')}" if price > 0 else "N/A",
+        "當前價格": format_price_label(price),
+        "幣種": app.currency,
+        "原價": app.formattedPrice,
+        "應用內購買": "是" if app.isGameCenterEnabled else "否",
+        "價格等級": f"Tier {app.price_tier}" if price > 0 else "N/A",
     }
 
     return price_info
 
 
-def calculate_credibility_score(app, reviews):
+def parse_release_date(value):
+    """
+    解析 iTunes 返回的時間字符串（固定為 YYYY-MM-DDTHH:MM:SSZ 格式）
+    :param value: 時間字符串
+    :return: datetime，格式不符時返回 None
+    """
+    if not isinstance(value, str) or len(value) != 20 or value[-1] != "Z":
+        return None
+
+    try:
+        return datetime.fromisoformat(value[:-1])
+    except ValueError:
+        return None
+
+
+def calculate_review_quality(reviews):
     """
-    計算應用的可信度評分
-    :param app: 應用信息
+    計算評論質量得分
     :param reviews: 應用評論列表
-    :return: 可信度評分 (0-100)
+    :return: 評論質量得分 (0-1)
+    """
+    if not reviews:
+        return 0.0
+
+    valid_reviews = 0
+    total_length = 0
+    review_count = len(reviews)
+
+    for review in reviews:
+        content = str(review.get("內容", ""))
+        # 檢查評論是否有效（不是簡單的表情符號或重複字符）
+        if len(content) > 10 and not _REPEAT_CHAR_RE.match(content):
+            valid_reviews += 1
+            total_length += len(content)
+
+    # 計算平均評論長度和有效評論比例
+    avg_length = total_length / review_count
+    valid_ratio = valid_reviews / review_count
+
+    return (min(1.0, avg_length / 100) + valid_ratio) / 2
+
+
+def calculate_credibility_scores(apps, reviews_list, now=None):
+    """
+    批量計算應用的可信度評分（對所有應用做一次向量化運算）
+    :param apps: AppRecord 應用信息列表
+    :param reviews_list: 與 apps 一一對應的評論列表
+    :param now: 計算時間衰減的基準時間，默認為當前時間
+    :return: 可信度評分列表 (0-100)
     """
     # 基礎數據
-    rating = float(app.get("averageUserRating", 0))
-    rating_count = int(app.get("userRatingCount", 0))
-    price = float(app.get("price", 0))
+    ratings = np.array([float(app.averageUserRating or 0) for app in apps], dtype=np.float64)
+    rating_counts = np.array([int(app.userRatingCount or 0) for app in apps], dtype=np.float64)
+    prices = np.array([float(app.price) for app in apps], dtype=np.float64)
 
     # 1. 評分數量權重 (使用對數函數平滑處理)
-    count_weight = min(1.0, math.log(rating_count + 1) / math.log(10000)) if rating_count > 0 else 0
+    count_weight = np.minimum(1.0, np.log1p(rating_counts) / _LOG_10000)
 
-    # 2. 評論質量分析
-    review_quality_score = 0
-    if reviews:
-        valid_reviews = 0
-        total_length = 0
+    # 2. 評論質量分析（逐個應用計算，評論數量有限）
+    review_quality_score = np.array([calculate_review_quality(reviews) for reviews in reviews_list], dtype=np.float64)
 
-        for review in reviews:
-            content = str(review.get("內容", ""))
-            # 檢查評論是否有效（不是簡單的表情符號或重複字符）
-            if len(content) > 10 and not re.match(r"^(.)\1*$", content):
-                valid_reviews += 1
-                total_length += len(content)
+    # 3. 評分分佈分析（高分但評分數少，可能有刷分嫌疑）
+    rating_distribution_score = np.where((ratings > 4.8) & (rating_counts < 100), 0.7, 1.0)
 
-        # 計算平均評論長度和有效評論比例
-        avg_length = total_length / len(reviews) if reviews else 0
-        valid_ratio = valid_reviews / len(reviews) if reviews else 0
+    # 付費應用額外評分加權（付費應用一般評分更嚴格）
+    rating_distribution_score = np.where(prices > 0, rating_distribution_score * 1.1, rating_distribution_score)
 
-        # 評論質量得分 (0-1)
-        review_quality_score = (min(1.0, avg_length / 100) + valid_ratio) / 2
+    # 4. 時間衰減因子（優先展示較新的應用），無法解析更新日期時記為 NaN
+    if now is None:
+        now = datetime.now()
+    days_since_update = np.empty(len(apps), dtype=np.float64)
+    for i, app in enumerate(apps):
+        update_date = parse_release_date(app.currentVersionReleaseDate)
+        days_since_update[i] = (now - update_date).days if update_date else np.nan
 
-    # 3. 評分分佈分析（檢測是否有刷分嫌疑）
-    rating_distribution_score = 1.0
-    if rating > 4.8 and rating_count < 100:  # 高分但評分數少，可能有刷分嫌疑
-        rating_distribution_score *= 0.7
+    time_decay = np.where(np.isnan(days_since_update), 0.5, np.exp(-days_since_update / 365))  # 一年的衰減率
+
+    # 綜合計算最終得分
+    base_score = (ratings * 0.4 + count_weight * 0.3 + review_quality_score * 0.2 + rating_distribution_score * 0.1) * 100
+    final_scores = base_score * (0.8 + 0.2 * time_decay)  # 時間衰減影響20%
+
+    # 使用內置 round（np.round 先乘 100 再取整，邊界值的進位結果與之不同）
+    return [round(score, 2) for score in final_scores.tolist()]
+
+
+def rss_label(node, *path):
+    """
+    沿路徑取出 RSS 節點的 label 值
+    :param node: RSS 節點（字典）
+    :param path: 依次訪問的鍵
+    :return: label 值，路徑不存在時返回 "N/A"
+    """
+    for key in path:
+        if not isinstance(node, dict):
+            return "N/A"
+        node = node.get(key)
+
+    return node.get("label", "N/A") if isinstance(node, dict) else "N/A"
 
-    # 付費應用額外評分加權（付費應用一般評分更嚴格）
-    if price > 0:
-        rating_distribution_score *= 1.1
 
-    # 4. 時間衰減因子（優先展示較新的應用）
+async def fetch_review_page(app_id, page):
+    """
+    獲取應用某一頁的評論
+    :param app_id: 應用ID
+    :param page: 頁碼（從 1 開始）
+    :return: 該頁評論列表，沒有評論或出錯時返回空列表
+    """
+    # App Store 評論 API
+    url = f"https://itunes.apple.com/rss/customerreviews/id={app_id}/sortBy=mostRecent/page={page}/json"
+
     try:
-        update_date = datetime.strptime(app.get("currentVersionReleaseDate", ""), "%Y-%m-%dT%H:%M:%SZ")
-        days_since_update = (datetime.now() - update_date).days
-        time_decay = math.exp(-days_since_update / 365)  # 一年的衰減率
-    except:
-        time_decay = 0.5
+        data = await fetch_json(url)
 
-    # 綜合計算最終得分
-    base_score = (rating * 0.4 + count_weight * 0.3 + review_quality_score * 0.2 + rating_distribution_score * 0.1) * 100
-    final_score = base_score * (0.8 + 0.2 * time_decay)  # 時間衰減影響20%
+        # 檢查是否有評論數據（與 rss_label 相同，結構不符時視為沒有評論）
+        feed = data.get("feed") if isinstance(data, dict) else None
+        entries = feed.get("entry") if isinstance(feed, dict) else None
+    except Exception as e:
+        print(f"獲取評論時出錯: {e}")
+        return []
+
+    if not entries or not isinstance(entries, list):
+        return []
 
-    return round(final_score, 2)
+    return [
+        {
+            "評論者": rss_label(entry, "author", "name"),
+            "評分": rss_label(entry, "im:rating"),
+            "標題": rss_label(entry, "title"),
+            "內容": rss_label(entry, "content"),
+            "版本": rss_label(entry, "im:version"),
+            "時間": rss_label(entry, "updated"),
+        }
+        for entry in entries
+    ]
 
 
-def fetch_reviews(app_id, country="tw", limit=50):
+async def fetch_reviews(app_id, country="tw", limit=50):
     """
-    獲取應用評論
+    獲取應用評論（所需頁面並發請求）
     :param app_id: 應用ID
     :param country: 國家/地區代碼
     :param limit: 評論數量
     :return: 評論列表
     """
+    if not app_id:
+        return []
+
+    # 評論 API 每頁最多返回 50 條，預先算出需要的頁數
+    pages_needed = -(-limit // REVIEWS_PER_PAGE)
+    pages = await asyncio.gather(*[fetch_review_page(app_id, page) for page in range(1, pages_needed + 1)])
+
     reviews = []
-    offset = 0
-
-    while len(reviews) < limit:
-        # App Store 評論 API
-        url = f"https://itunes.apple.com/rss/customerreviews/id={app_id}/sortBy=mostRecent/page={offset + 1}/json"
-
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-
-            # 檢查是否有評論數據
-            entries = data.get("feed", {}).get("entry", [])
-            if not entries or not isinstance(entries, list):
-                break
-
-            for entry in entries:
-                review = {
-                    "評論者": entry.get("author", {}).get("name", {}).get("label", "N/A"),
-                    "評分": entry.get("im:rating", {}).get("label", "N/A"),
-                    "標題": entry.get("title", {}).get("label", "N/A"),
-                    "內容": entry.get("content", {}).get("label", "N/A"),
-                    "版本": entry.get("im:version", {}).get("label", "N/A"),
-                    "時間": entry.get("updated", {}).get("label", "N/A"),
-                }
-                reviews.append(review)
-
-            if len(reviews) >= limit:
-                break
-
-            offset += 1
-            time.sleep(1)  # 避免請求過於頻繁
-
-        except Exception as e:
-            print(f"獲取評論時出錯: {e}")
+    for page_reviews in pages:
+        # 某頁沒有評論時，後續頁面也不會再有
+        if not page_reviews:
             break
+        reviews.extend(page_reviews)
 
     return reviews[:limit]
 
 
-def search_apps(keyword, country="tw", limit=200):
+async def search_apps(keyword, country="tw", limit=200):
     """
     搜索 App Store 應用
     :param keyword: 搜索關鍵字
@@ -162,52 +360,79 @@ def search_apps(keyword, country="tw", limit=200):
     url = f"https://itunes.apple.com/search?term={encoded_keyword}&country={country}&entity=software&limit={limit}"
 
     try:
-        # 發送請求
-        response = requests.get(url)
-        response.raise_for_status()  # 檢查請求是否成功
-
-        # 解析 JSON 響應
-        data = response.json()
+        # 發送請求並解析 JSON 響應
+        data = await fetch_json(url)
 
         return data.get("results", [])
 
-    except requests.exceptions.RequestException as e:
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
         print(f"請求出錯: {e}")
         return []
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"JSON 解析錯誤: {e}")
         return []
 
 
-def print_app_info(app, score):
+def build_app_data(app, reviews, credibility_score):
+    """
+    整理輸出用的應用數據（每個應用只整理一次，供 JSON 和終端輸出共用）
+    :param app: AppRecord 應用信息
+    :param reviews: 應用評論列表
+    :param credibility_score: 可信度評分
+    :return: 應用數據字典
+    """
+    return {
+        "應用名稱": app.trackName,
+        "開發者": app.artistName,
+        "應用類別": app.primaryGenreName,
+        "價格信息": format_price(app),
+        "評分": "N/A" if app.averageUserRating is None else app.averageUserRating,
+        "評分數量": "N/A" if app.userRatingCount is None else app.userRatingCount,
+        "版本": app.version,
+        "大小(bytes)": app.fileSizeBytes,
+        "最低系統要求": f"iOS {app.minimumOsVersion}",
+        "App Store 链接": app.trackViewUrl,
+        "更新日期": app.currentVersionReleaseDate,
+        "應用描述": app.description,
+        "credibility_score": credibility_score,
+        "評論": reviews,
+    }
+
+
+def print_app_info(app_data, score):
     """
-    格式化打印應用信息
-    :param app: 應用信息字典
+    格式化打印應用信息（整塊內容拼接後一次輸出）
+    :param app_data: build_app_data 整理後的應用數據
     :param score: 可信度評分
     """
-    print("\n" + "=" * 50)
-    print(f"應用名稱: {app.get('trackName', 'N/A')}")
-    print(f"開發者: {app.get('artistName', 'N/A')}")
-    print(f"應用類別: {app.get('primaryGenreName', 'N/A')}")
-
-    # 打印價格詳細信息
-    price_info = app.get("價格信息", {})
-    print(f"價格類型: {price_info.get('價格類型', 'N/A')}")
-    print(f"當前價格: {price_info.get('當前價格', 'N/A')}")
-    print(f"幣種: {price_info.get('幣種', 'N/A')}")
-    if price_info.get("價格類型") == "付費":
-        print(f"原價: {price_info.get('原價', 'N/A')}")
-        print(f"價格等級: {price_info.get('價格等級', 'N/A')}")
-    print(f"應用內購買: {price_info.get('應用內購買', 'N/A')}")
-
-    print(f"評分: {app.get('averageUserRating', 'N/A')}")
-    print(f"評分數量: {app.get('userRatingCount', 'N/A')}")
-    print(f"可信度評分: {score}")
-    print(f"版本: {app.get('version', 'N/A')}")
-    print(f"大小: {app.get('fileSizeBytes', 'N/A')} bytes")
-    print(f"最低系統要求: iOS {app.get('minimumOsVersion', 'N/A')}")
-    print(f"App Store 链接: {app.get('trackViewUrl', 'N/A')}")
-    print("=" * 50)
+    price_info = app_data["價格信息"]
+
+    lines = [
+        "\n" + "=" * 50,
+        f"應用名稱: {app_data['應用名稱']}",
+        f"開發者: {app_data['開發者']}",
+        f"應用類別: {app_data['應用類別']}",
+        # 價格詳細信息
+        f"價格類型: {price_info['價格類型']}",
+        f"當前價格: {price_info['當前價格']}",
+        f"幣種: {price_info['幣種']}",
+    ]
+    if price_info["價格類型"] == "付費":
+        lines.append(f"原價: {price_info['原價']}")
+        lines.append(f"價格等級: {price_info['價格等級']}")
+    lines += [
+        f"應用內購買: {price_info['應用內購買']}",
+        f"評分: {app_data['評分']}",
+        f"評分數量: {app_data['評分數量']}",
+        f"可信度評分: {score}",
+        f"版本: {app_data['版本']}",
+        f"大小: {app_data['大小(bytes)']} bytes",
+        f"最低系統要求: {app_data['最低系統要求']}",
+        f"App Store 链接: {app_data['App Store 链接']}",
+        "=" * 50,
+    ]
+
+    print("\n".join(lines))
 
 
 def save_to_json(apps_with_reviews, keyword):
@@ -223,21 +448,32 @@ def save_to_json(apps_with_reviews, keyword):
     # 按可信度評分排序
     sorted_apps = sorted(apps_with_reviews, key=lambda x: x["credibility_score"], reverse=True)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(sorted_apps, f, ensure_ascii=False, indent=2)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(sorted_apps, option=orjson.OPT_INDENT_2))
 
     return filename
 
 
-def main():
+async def main():
     """
     主函數
     """
+    try:
+        await crawl()
+    finally:
+        await close_session()
+
+
+async def crawl():
+    """
+    搜索應用、獲取評論並輸出結果
+    """
     print("歡迎使用 App Store 爬蟲程式！")
-    keyword = input("請輸入要搜索的應用關鍵字: ")
+    keyword = input("請輸入要搜索的應用關鍵字: ").strip()
 
     print("\n正在搜索，請稍候...\n")
-    apps = search_apps(keyword)
+    # 搜索結果只轉換一次，後續統一通過屬性訪問
+    apps = [AppRecord.from_api(result) for result in await search_apps(keyword)]
 
     if not apps:
         print("未找到相關應用或發生錯誤。")
@@ -245,39 +481,18 @@ def main():
 
     print(f"找到 {len(apps)} 個相關應用")
 
-    # 獲取應用信息和評論，並計算可信度評分
-    apps_with_reviews = []
-
-    for app in apps:
-        print(f"\n正在獲取 {app.get('trackName', 'N/A')} 的評論...")
-
-        # 獲取評論
-        reviews = fetch_reviews(app.get("trackId")) if app.get("trackId") else []
-
-        # 計算可信度評分
-        credibility_score = calculate_credibility_score(app, reviews)
-
-        # 獲取價格詳細信息
-        price_info = format_price(app)
-
-        # 整理應用數據
-        app_data = {
-            "應用名稱": app.get("trackName", "N/A"),
-            "開發者": app.get("artistName", "N/A"),
-            "應用類別": app.get("primaryGenreName", "N/A"),
-            "價格信息": price_info,
-            "評分": app.get("averageUserRating", "N/A"),
-            "評分數量": app.get("userRatingCount", "N/A"),
-            "版本": app.get("version", "N/A"),
-            "大小(bytes)": app.get("fileSizeBytes", "N/A"),
-            "最低系統要求": f"iOS {app.get('minimumOsVersion', 'N/A')}",
-            "App Store 链接": app.get("trackViewUrl", "N/A"),
-            "更新日期": app.get("currentVersionReleaseDate", "N/A"),
-            "應用描述": app.get("description", "N/A"),
-            "credibility_score": credibility_score,
-            "評論": reviews,
-        }
-        apps_with_reviews.append(app_data)
+    # 並發獲取所有應用的評論
+    print(f"\n正在獲取 {len(apps)} 個應用的評論...")
+    reviews_list = await asyncio.gather(*[fetch_reviews(app.trackId) for app in apps])
+
+    # 計算可信度評分
+    credibility_scores = calculate_credibility_scores(apps, reviews_list, now=datetime.now())
+
+    # 整理應用數據
+    apps_with_reviews = [
+        build_app_data(app, reviews, credibility_score)
+        for app, reviews, credibility_score in zip(apps, reviews_list, credibility_scores)
+    ]
 
     # 保存到 JSON
     filename = save_to_json(apps_with_reviews, keyword)
@@ -291,4 +506,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())